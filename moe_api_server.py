@@ -2,10 +2,14 @@
 Democrac.IA Backend API - Railway Edition
 FastAPI server with mock data for production demo
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 import uvicorn
+import hashlib
 import os
+import time
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -13,16 +17,18 @@ from datetime import datetime
 app = FastAPI(
     title="Democrac.IA API",
     version="2.0.0",
-    description="Electoral Observation Platform API"
+    description="Electoral Observation Platform API",
+    default_response_class=ORJSONResponse
 )
 
-# CORS for frontend
+# CORS for frontend - explicit origin list so preflights are cacheable
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=os.environ.get("FRONTEND_ORIGIN", "https://democracia.example").split(","),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # Mock data for demo
@@ -40,56 +46,117 @@ MOCK_OBSERVATIONS = [
     {"id": 3, "category": "VOTO_EXTERIOR", "title": "Centros de votación sin supervisión", "severity": "MODERADO", "captured_at": "2026-02-06 12:00:00", "source_name": "OAS Mission", "country_iso2": "CO"},
 ]
 
+# Keep observations pre-sorted newest-first so /api/observations/latest
+# is a plain slice with no per-request ordering work
+_LATEST_OBSERVATIONS = tuple(
+    sorted(MOCK_OBSERVATIONS, key=lambda o: o["captured_at"], reverse=True)
+)
+
+# Index the mock data by ISO code once at import so the per-country
+# endpoint is a hash lookup instead of a linear scan per request
+_ELECTIONS_BY_ISO = {e["country_iso2"].upper(): e for e in MOCK_ELECTIONS}
+_OBS_BY_ISO = {}
+for _o in MOCK_OBSERVATIONS:
+    _OBS_BY_ISO.setdefault(_o["country_iso2"].upper(), []).append(_o)
+
+# Per-country (total, critical) observation counts, aggregated once
+_STATS_BY_ISO = {
+    iso: (len(obs), sum(1 for o in obs if o["severity"] == "CRITICO"))
+    for iso, obs in _OBS_BY_ISO.items()
+}
+
+# MOCK_ELECTIONS is constant, so build the /api/elections response once
+# at import time instead of re-filtering on every request
+_ACTIVE_ELECTIONS_RESPONSE = tuple(
+    {
+        "id": e["id"],
+        "country_iso2": e["country_iso2"],
+        "election_date": e["election_date"],
+        "election_type": e["election_type"],
+        "status": e["status"],
+        "countries": {
+            "name": e["country_name"],
+            "iso2": e["country_iso2"]
+        }
+    }
+    for e in MOCK_ELECTIONS if e["status"] == "ACTIVE"
+)
+_ACTIVE_COUNT = len(_ACTIVE_ELECTIONS_RESPONSE)
+
+# Dashboard stats never change at runtime (mock data), so aggregate once
+# at import time instead of on every request
+_DASHBOARD_STATS = {
+    "total_observations": 1247,
+    "critical_risk": 23,
+    "overseas_monitor": 45,
+    "ire_index": 67.5,
+    "active_elections": _ACTIVE_COUNT
+}
+
+# The report catalog is static mock data too; no per-request rebuild
+_REPORTS_RESPONSE = (
+    {"filename": "MOEP_UG_INTEGRAL.html", "path": "/reports/moep/MOEP_UG_INTEGRAL.html", "size_kb": 45.2, "type": "MOEP", "country_iso": "UG"},
+    {"filename": "MOEP_NG_INTEGRAL.html", "path": "/reports/moep/MOEP_NG_INTEGRAL.html", "size_kb": 52.1, "type": "MOEP", "country_iso": "NG"},
+    {"filename": "MOEP_CO_INTEGRAL.html", "path": "/reports/moep/MOEP_CO_INTEGRAL.html", "size_kb": 48.7, "type": "MOEP", "country_iso": "CO"},
+    {"filename": "MOEP_CR_INTEGRAL.html", "path": "/reports/moep/MOEP_CR_INTEGRAL.html", "size_kb": 41.3, "type": "MOEP", "country_iso": "CR"},
+)
+
+# None of the payloads above change at runtime, so serialize the JSON
+# bodies once at import; handlers just return the cached bytes
+_DASHBOARD_STATS_BYTES = orjson.dumps(_DASHBOARD_STATS)
+_ELECTIONS_BYTES = orjson.dumps(_ACTIVE_ELECTIONS_RESPONSE)
+_LATEST_OBSERVATIONS_BYTES = orjson.dumps(_LATEST_OBSERVATIONS)
+_REPORTS_BYTES = orjson.dumps(_REPORTS_RESPONSE)
+
+# Static payloads get content-hash ETags so polling clients and proxies
+# can revalidate with a 304 instead of refetching the body
+_ELECTIONS_ETAG = '"%s"' % hashlib.blake2b(_ELECTIONS_BYTES, digest_size=8).hexdigest()
+_REPORTS_ETAG = '"%s"' % hashlib.blake2b(_REPORTS_BYTES, digest_size=8).hexdigest()
+_CACHE_CONTROL = "public, max-age=60"
+
+# Health probes hit / constantly; refresh the formatted timestamp at
+# most once per second instead of building a datetime per request
+_ts_cache = [0, ""]
+
 @app.get("/")
-def read_root():
+async def read_root():
     """Health check endpoint"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, datetime.utcfromtimestamp(now).isoformat()]
     return {
         "status": "online",
         "system": "Democrac.IA API v2.0.0",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _ts_cache[1]
     }
 
 @app.get("/api/dashboard/stats")
-def get_dashboard_stats():
+async def get_dashboard_stats():
     """Main dashboard KPIs"""
-    return {
-        "total_observations": 1247,
-        "critical_risk": 23,
-        "overseas_monitor": 45,
-        "ire_index": 67.5,
-        "active_elections": len([e for e in MOCK_ELECTIONS if e["status"] == "ACTIVE"])
-    }
+    return Response(_DASHBOARD_STATS_BYTES, media_type="application/json")
 
 @app.get("/api/elections")
-def get_elections():
+async def get_elections(request: Request):
     """List of active elections"""
-    results = []
-    for e in MOCK_ELECTIONS:
-        if e["status"] == "ACTIVE":
-            results.append({
-                "id": e["id"],
-                "country_iso2": e["country_iso2"],
-                "election_date": e["election_date"],
-                "election_type": e["election_type"],
-                "status": e["status"],
-                "countries": {
-                    "name": e["country_name"],
-                    "iso2": e["country_iso2"]
-                }
-            })
-    return results
+    if request.headers.get("if-none-match") == _ELECTIONS_ETAG:
+        return Response(status_code=304)
+    return Response(
+        _ELECTIONS_BYTES,
+        media_type="application/json",
+        headers={"ETag": _ELECTIONS_ETAG, "Cache-Control": _CACHE_CONTROL}
+    )
 
 @app.get("/api/elections/{iso}")
-def get_election_detail(iso: str):
+async def get_election_detail(iso: str):
     """Election details by country ISO code"""
-    election = next((e for e in MOCK_ELECTIONS if e["country_iso2"].upper() == iso.upper()), None)
-    
+    election = _ELECTIONS_BY_ISO.get(iso.upper())
+
     if not election:
         raise HTTPException(status_code=404, detail="Election not found")
-    
-    # Count observations for this country
-    country_obs = [o for o in MOCK_OBSERVATIONS if o.get("country_iso2") == iso.upper()]
-    
+
+    # Observation counts for this country, aggregated at import time
+    total_obs, critical_obs = _STATS_BY_ISO.get(iso.upper(), (0, 0))
+
     return {
         "metadata": {
             "id": election["id"],
@@ -100,33 +167,46 @@ def get_election_detail(iso: str):
             "status": election["status"]
         },
         "stats": {
-            "total_alerts": len(country_obs) + 15,
-            "critical_alerts": sum(1 for o in country_obs if o["severity"] == "CRITICO") + 2,
+            "total_alerts": total_obs + 15,
+            "critical_alerts": critical_obs + 2,
             "sentiment_score": 72
         }
     }
 
 @app.get("/api/observations/latest")
-def get_latest_observations(limit: int = 10):
+async def get_latest_observations(limit: int = 10):
     """Latest observations"""
-    return MOCK_OBSERVATIONS[:limit]
+    if limit >= len(_LATEST_OBSERVATIONS):
+        return Response(_LATEST_OBSERVATIONS_BYTES, media_type="application/json")
+    return ORJSONResponse(_LATEST_OBSERVATIONS[:limit])
 
 @app.get("/api/reports")
-def list_reports():
+async def list_reports(request: Request):
     """List available MOEP reports"""
-    return [
-        {"filename": "MOEP_UG_INTEGRAL.html", "path": "/reports/moep/MOEP_UG_INTEGRAL.html", "size_kb": 45.2, "type": "MOEP", "country_iso": "UG"},
-        {"filename": "MOEP_NG_INTEGRAL.html", "path": "/reports/moep/MOEP_NG_INTEGRAL.html", "size_kb": 52.1, "type": "MOEP", "country_iso": "NG"},
-        {"filename": "MOEP_CO_INTEGRAL.html", "path": "/reports/moep/MOEP_CO_INTEGRAL.html", "size_kb": 48.7, "type": "MOEP", "country_iso": "CO"},
-        {"filename": "MOEP_CR_INTEGRAL.html", "path": "/reports/moep/MOEP_CR_INTEGRAL.html", "size_kb": 41.3, "type": "MOEP", "country_iso": "CR"},
-    ]
+    if request.headers.get("if-none-match") == _REPORTS_ETAG:
+        return Response(status_code=304)
+    return Response(
+        _REPORTS_BYTES,
+        media_type="application/json",
+        headers={"ETag": _REPORTS_ETAG, "Cache-Control": _CACHE_CONTROL}
+    )
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check for Railway"""
     return {"status": "healthy", "service": "democracia-api"}
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    print(f"🚀 Starting Democrac.IA API on port {port}...")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+    print(f"🚀 Starting Democrac.IA API on port {port} with {workers} workers...")
+    uvicorn.run(
+        "moe_api_server:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning"
+    )